@@ -1,28 +1,192 @@
-import psutil
 import time
 import os
 import re
 import sys
 import argparse
+import glob
+import atexit
+import functools
 import json
-from datetime import datetime
+import math
+import shutil
+import signal
+import struct
+import threading
+from collections import namedtuple
+from datetime import datetime, timezone
+
+try:
+    import orjson
+except ImportError: # Optional, the standard json module is used without it
+    orjson = None
+
+# ANSI escape codes are only emitted when the stream they are written to is a
+# terminal, so piped or redirected output stays plain text.
+IS_TTY = sys.stdout.isatty()
+IS_STDERR_TTY = sys.stderr.isatty()
+
+def ansi(code, is_tty=IS_TTY):
+    """Returns the ANSI escape code, or an empty string when the stream is not a terminal."""
+    return code if is_tty else ""
 
 # Define ANSI escape codes directly
-ANSI_RESET = "\x1b[0m"
-ANSI_RED = "\x1b[31m"
-ANSI_GREEN = "\x1b[32m"
-ANSI_YELLOW = "\x1b[33m"
-ANSI_BLUE = "\x1b[34m"
-ANSI_CYAN = "\x1b[36m"
-ANSI_WHITE = "\x1b[37m"
-
-def clear_console():
+ANSI_RESET = ansi("\x1b[0m")
+ANSI_RED = ansi("\x1b[31m")
+ANSI_GREEN = ansi("\x1b[32m")
+ANSI_YELLOW = ansi("\x1b[33m")
+ANSI_BLUE = ansi("\x1b[34m")
+ANSI_CYAN = ansi("\x1b[36m")
+ANSI_WHITE = ansi("\x1b[37m")
+ANSI_BOLD_RED = ansi("\x1b[1;31m")
+
+# Same codes for messages written to stderr
+STDERR_RESET = ansi("\x1b[0m", IS_STDERR_TTY)
+STDERR_RED = ansi("\x1b[31m", IS_STDERR_TTY)
+STDERR_YELLOW = ansi("\x1b[33m", IS_STDERR_TTY)
+
+# Moves the cursor to the top-left of the console and clears the screen from that point.
+# This prevents flickering compared to os.system('clear/cls').
+CLEAR_SCREEN = ansi("\x1b[H\x1b[J")
+
+# Column widths of the temperature tables
+LABEL_WIDTH = 12
+TEMP_VALUE_WIDTH = 7
+
+# Headroom (°C) below the critical limit under which a temperature is highlighted
+NEAR_CRITICAL_MARGIN = 5.0
+
+# Adaptive polling (--base-interval): headroom (°C) at which the base interval
+# is used, and bounds of the resulting interval (seconds)
+ADAPTIVE_MARGIN = 30.0
+MIN_POLL_INTERVAL = 0.25
+MAX_POLL_INTERVAL = 10.0
+
+# Templates of the table cells, built once
+PLAIN_LABEL_TEMPLATE = f"{{label:<{LABEL_WIDTH}}}"
+LABEL_TEMPLATE = f"{{color}}{{label:<{LABEL_WIDTH}}}{ANSI_RESET}"
+CURRENT_CELL_TEMPLATE = f"{{color}}{{value:<{TEMP_VALUE_WIDTH+1}}}{ANSI_RESET}"
+LIMITS_TEMPLATE = (f"{{high:<{TEMP_VALUE_WIDTH+1}}}{ANSI_RESET}"
+                   f"{{critical:<{TEMP_VALUE_WIDTH+1}}}{ANSI_RESET}")
+COLUMN_SPACER = "     "
+
+# Set to stop the interactive mode loops (sampler and renderer)
+_stop_event = threading.Event()
+
+# Seconds to wait for the sampler thread to finish its current read on exit
+STOP_JOIN_TIMEOUT = 0.5
+
+# Rows of the last frame drawn in interactive mode, used to redraw only changes
+_prev_rows = []
+
+# Terminal size and monotonic time of the last full redraw. The whole frame is
+# redrawn when the terminal is resized and every FULL_REDRAW_INTERVAL seconds,
+# so the display recovers from anything that scrolled or overwrote it.
+_prev_terminal_size = None
+_last_full_redraw = 0.0
+FULL_REDRAW_INTERVAL = 10.0
+
+# hwmon drivers that expose CPU temperatures, in order of preference.
+# Any other hwmon device (1-wire, nvme, ...) is never read, since some of them
+# can take up to a second per sample. psutil is only used when sysfs has no
+# hwmon class, because it samples every device.
+HWMON_ROOT = "/sys/class/hwmon"
+CPU_HWMON_NAMES = ("coretemp", "k10temp", "zenpower", "acpitz")
+
+# Same fields as psutil's shwtemp, so both sources can be handled alike.
+SensorReading = namedtuple("SensorReading", ["label", "current", "high", "critical"])
+
+# Cached (label, input_fd, high, critical) tuples, one list per CPU hwmon device.
+# None means the devices have not been resolved yet, [] means none was found.
+_hwmon_devices = None
+
+# Names of every hwmon device found by the scan, reported when none of them is
+# a CPU one. Stays None when sysfs has no hwmon class (e.g. not Linux).
+_hwmon_names = None
+
+# --msr: Intel thermal MSRs, read through the msr kernel module (needs root).
+# The temperature is TjMax (IA32_TEMPERATURE_TARGET bits 23:16) minus the
+# digital readout of the thermal status register (bits 22:16).
+MSR_PATH_PATTERN = "/dev/cpu/*/msr"
+CPU_TOPOLOGY_DIR = "/sys/devices/system/cpu/cpu{cpu}/topology"
+IA32_THERM_STATUS = 0x19C
+IA32_TEMPERATURE_TARGET = 0x1A2
+IA32_PACKAGE_THERM_STATUS = 0x1B1
+# IA32_THERM_STATUS bit 31: the digital readout holds a valid reading
+MSR_READING_VALID = 1 << 31
+
+# Fallback of --msr when the MSRs can't be read: CPU thermal zones. These all
+# cover a whole CPU package; board zones such as acpitz are not CPU sensors.
+THERMAL_ROOT = "/sys/class/thermal"
+CPU_THERMAL_ZONE_TYPES = ("x86_pkg_temp", "cpu-thermal", "cpu_thermal")
+
+# Cached (label, fd, msr_register, high, critical) tuples for --msr.
+# msr_register is None for thermal zone files, which hold millidegrees.
+# None means the sensors have not been resolved yet, [] means none was found.
+_msr_sensors = None
+
+
+class _SensorPool:
     """
-    Moves the cursor to the top-left of the console and clears the screen from that point.
-    This prevents flickering compared to os.system('clear/cls').
-    Uses raw ANSI escape codes.
+    Keeps sysfs attribute files open across polls, keyed by path.
+    Reading an open fd from offset 0 returns a fresh value, which saves an
+    open() and close() per sensor on every poll.
     """
-    sys.stdout.write("\x1b[H\x1b[J")
+
+    def __init__(self):
+        self._fds = {}
+
+    def open(self, path):
+        """Returns the fd of path, opening it on first use."""
+        fd = self._fds.get(path)
+        if fd is None:
+            fd = os.open(path, os.O_RDONLY)
+            self._fds[path] = fd
+        return fd
+
+    @staticmethod
+    def read(fd):
+        """Reads a millidegree attribute from an open fd and returns it in °C."""
+        return int(os.pread(fd, 32, 0)) / 1000.0
+
+    def close(self):
+        """Closes every fd held by the pool."""
+        for fd in self._fds.values():
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self._fds.clear()
+
+
+_sensor_pool = _SensorPool()
+atexit.register(_sensor_pool.close)
+
+# Package/core layout of the CPU sensors, detected on the first poll.
+# high/critical limits are snapshotted here too, as they are hardware constants,
+# along with the static (prefix, suffix) strings of the table rows built from them.
+# core_rows holds ((index, prefix, suffix), (index, prefix, suffix) or None) per
+# row of the two-column core table, indexing the sorted cores.
+CpuTopology = namedtuple("CpuTopology", [
+    "sensor_count", "package_index", "package_limits", "package_row_parts",
+    "core_indices", "core_labels", "core_short_labels", "core_limits", "core_rows"
+])
+_topology = None
+
+# (unix second, ISO 8601 string) of the last timestamp built
+_timestamp_cache = (None, "")
+
+_CORE_NUM_RE = re.compile(r'(\d+)')
+_sort_key_cache = {}
+
+def dumps_json(data):
+    """Serializes data as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
+def write_frame(parts):
+    """Writes a list of output fragments to stdout with a single write and flush."""
+    sys.stdout.write("".join(parts))
     sys.stdout.flush()
 
 def get_temp_color(temperature):
@@ -34,172 +198,614 @@ def get_temp_color(temperature):
     else:
         return ANSI_RED
 
+def get_temp_limit(sensor_info):
+    """Returns the critical temperature of a sensor, or its high one if there is no critical."""
+    if sensor_info.get("critical") is not None:
+        return sensor_info["critical"]
+    return sensor_info.get("high")
+
+def is_near_critical(sensor_info):
+    """Whether a sensor is within NEAR_CRITICAL_MARGIN °C of its limit."""
+    limit = get_temp_limit(sensor_info)
+    if limit is None or sensor_info["current"] is None:
+        return False
+    return limit - sensor_info["current"] < NEAR_CRITICAL_MARGIN
+
 def get_sort_key(sensor):
-    """Helper function to extract a sortable key from the sensor label (for cores only)."""
+    """
+    Helper function to extract a sortable key from the sensor label (for cores only).
+    Results are memoized per label, since sensors report the same labels on every poll.
+    """
     label = sensor.label
-    match = re.search(r'(\d+)', label)
-    if match:
-        return int(match.group(1))
-    return 9999
+    key = _sort_key_cache.get(label)
+    if key is None:
+        match = _CORE_NUM_RE.search(label)
+        key = int(match.group(1)) if match else 9999
+        _sort_key_cache[label] = key
+    return key
+
+def read_sysfs_value(path):
+    """Reads a single sysfs attribute and returns it stripped, or None if it can't be read."""
+    try:
+        with open(path, "r") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+def read_sysfs_millidegrees(path):
+    """Reads a millidegree sysfs attribute and returns it in °C, or None if unavailable."""
+    value = read_sysfs_value(path)
+    try:
+        return int(value) / 1000.0
+    except (TypeError, ValueError):
+        return None
+
+def scan_hwmon_devices():
+    """
+    Returns the hwmon device directories grouped by driver name.
+    Only the hwmon*/name attributes are read, so slow sensors are never sampled.
+    """
+    devices = {}
+    for name_path in sorted(glob.glob(os.path.join(HWMON_ROOT, "hwmon*", "name"))):
+        name = read_sysfs_value(name_path)
+        if name:
+            devices.setdefault(name, []).append(os.path.dirname(name_path))
+    return devices
+
+def init_hwmon_device(hwmon_dir):
+    """
+    Opens the tempN_input files of a hwmon device and returns its
+    (label, input_fd, high, critical) tuples.
+    high/critical limits are hardware constants, so they are read only here.
+    """
+    sensors = []
+    for entry in sorted(os.listdir(hwmon_dir)):
+        match = re.fullmatch(r'temp(\d+)_input', entry)
+        if not match:
+            continue
+        prefix = os.path.join(hwmon_dir, f"temp{match.group(1)}")
+        try:
+            fd = _sensor_pool.open(prefix + "_input")
+            _SensorPool.read(fd) # Drop inputs that can't be read at all
+        except (OSError, ValueError):
+            continue
+        label = read_sysfs_value(prefix + "_label") or f"temp{match.group(1)}"
+        high = read_sysfs_millidegrees(prefix + "_max")
+        critical = read_sysfs_millidegrees(prefix + "_crit")
+        sensors.append((label, fd, high, critical))
+    return sensors
+
+def init_hwmon_sensors():
+    """
+    Resolves the devices of the preferred CPU hwmon driver (one per physical
+    package on multi-socket systems) and opens their tempN_input files.
+    This runs once; later polls never scan /sys/class/hwmon again.
+    """
+    global _hwmon_devices, _hwmon_names
+    _hwmon_devices = []
+    if not os.path.isdir(HWMON_ROOT):
+        return
+
+    devices = scan_hwmon_devices()
+    _hwmon_names = sorted(devices)
+    for name in CPU_HWMON_NAMES:
+        for hwmon_dir in devices.get(name, []):
+            sensors = init_hwmon_device(hwmon_dir)
+            if sensors:
+                _hwmon_devices.append(sensors)
+        if _hwmon_devices:
+            return
+
+def read_hwmon_device(sensors):
+    """
+    Returns a list of SensorReading for the already opened sensors of one device.
+    A sensor that can't be read (e.g. its CPU was taken offline) reports None
+    as its current temperature, the others are still returned.
+    """
+    readings = []
+    for label, fd, high, critical in sensors:
+        try:
+            current = _SensorPool.read(fd)
+        except (OSError, ValueError):
+            current = None
+        readings.append(SensorReading(label, current, high, critical))
+    return readings
+
+def read_hwmon_temperatures():
+    """
+    Returns a list of SensorReading for the CPU hwmon devices (empty if there
+    is none), or None if sysfs has no hwmon class at all.
+    Each call only preads the already opened tempN_input files.
+    With several devices, the extra ones are read on short-lived daemon threads
+    so their latencies overlap, and a stuck read never holds up interpreter exit.
+    """
+    if _hwmon_devices is None:
+        init_hwmon_sensors()
+    if _hwmon_names is None:
+        return None
+    if not _hwmon_devices:
+        return []
+
+    if len(_hwmon_devices) == 1:
+        return read_hwmon_device(_hwmon_devices[0])
+
+    device_readings = [None] * len(_hwmon_devices)
+
+    def read_device(index):
+        device_readings[index] = read_hwmon_device(_hwmon_devices[index])
+
+    threads = [threading.Thread(target=read_device, args=(index,), daemon=True)
+               for index in range(1, len(_hwmon_devices))]
+    for thread in threads:
+        thread.start()
+    read_device(0)
+    for thread in threads:
+        thread.join()
+
+    readings = []
+    for device in device_readings:
+        readings.extend(device)
+    return readings
+
+def read_msr(fd, register):
+    """Reads a 64-bit model specific register from an open /dev/cpu/N/msr fd."""
+    return struct.unpack("<Q", os.pread(fd, 8, register))[0]
+
+def init_msr_cpu_sensors():
+    """
+    Opens /dev/cpu/N/msr for one logical CPU of every core and package and
+    returns their (label, fd, msr_register, high, critical) tuples.
+    TjMax is used as both limits, like coretemp does for its critical limit.
+    Each register is read once here, so CPUs without package thermal
+    management (no IA32_PACKAGE_THERM_STATUS) only report their cores.
+    """
+    sensors = []
+    seen_packages = set()
+    seen_cores = set()
+    msr_paths = glob.glob(MSR_PATH_PATTERN)
+    msr_paths.sort(key=lambda path: int(path.split(os.sep)[-2]))
+
+    for msr_path in msr_paths:
+        topology_dir = CPU_TOPOLOGY_DIR.format(cpu=msr_path.split(os.sep)[-2])
+        package_id = read_sysfs_value(os.path.join(topology_dir, "physical_package_id"))
+        core_id = read_sysfs_value(os.path.join(topology_dir, "core_id"))
+        if (package_id, core_id) in seen_cores:
+            continue # Hyper-threading sibling, the core sensor is shared
+        try:
+            fd = _sensor_pool.open(msr_path)
+            tjmax = float((read_msr(fd, IA32_TEMPERATURE_TARGET) >> 16) & 0xFF)
+            read_msr(fd, IA32_THERM_STATUS)
+        except OSError:
+            continue
+        if not tjmax:
+            continue # Some hypervisors report a TjMax of 0, the readings would be meaningless
+        seen_cores.add((package_id, core_id))
+
+        if package_id not in seen_packages:
+            seen_packages.add(package_id)
+            try:
+                read_msr(fd, IA32_PACKAGE_THERM_STATUS)
+            except OSError:
+                pass
+            else:
+                    sensors.append((f"Package id {package_id}", fd, IA32_PACKAGE_THERM_STATUS, tjmax, tjmax))
+        sensors.append((f"Core {core_id}", fd, IA32_THERM_STATUS, tjmax, tjmax))
+    return sensors
+
+def init_thermal_zone_sensors():
+    """
+    Opens the temp files of the CPU thermal zones and returns their
+    (label, fd, None, high, critical) tuples. The 'critical' trip point is
+    used as both limits. Each zone is a package sensor, there are no per-core zones.
+    """
+    sensors = []
+    package_count = 0
+    for zone_dir in sorted(glob.glob(os.path.join(THERMAL_ROOT, "thermal_zone*"))):
+        zone_type = read_sysfs_value(os.path.join(zone_dir, "type"))
+        if zone_type not in CPU_THERMAL_ZONE_TYPES:
+            continue
+        try:
+            fd = _sensor_pool.open(os.path.join(zone_dir, "temp"))
+        except OSError:
+            continue
+
+        critical = None
+        for trip_type_path in glob.glob(os.path.join(zone_dir, "trip_point_*_type")):
+            if read_sysfs_value(trip_type_path) == "critical":
+                critical = read_sysfs_millidegrees(trip_type_path[:-len("type")] + "temp")
+                break
+
+        sensors.append((f"Package id {package_count}", fd, None, critical, critical))
+        package_count += 1
+    return sensors
 
-def get_cpu_data_structured():
+def read_msr_temperatures():
+    """
+    Returns a list of SensorReading from the thermal MSRs, or from the CPU
+    thermal zones when the MSRs can't be read (no msr module, not root, not
+    Intel). Empty if neither is available.
+    """
+    global _msr_sensors
+    if _msr_sensors is None:
+        _msr_sensors = init_msr_cpu_sensors() or init_thermal_zone_sensors()
+
+    readings = []
+    for label, fd, register, high, critical in _msr_sensors:
+        try:
+            if register is None:
+                current = _SensorPool.read(fd)
+            else:
+                status = read_msr(fd, register)
+                if register == IA32_THERM_STATUS and not status & MSR_READING_VALID:
+                    current = None # The core hasn't latched a valid reading
+                else:
+                    current = critical - ((status >> 16) & 0x7F)
+        except (OSError, ValueError):
+            current = None # e.g. the CPU was taken offline
+        readings.append(SensorReading(label, current, high, critical))
+    return readings
+
+def detect_cpu_topology(sensors):
+    """
+    Classifies the sensors into package and cores, and sorts the cores.
+    Sensor identity doesn't change at runtime, so this only runs once and
+    the result is reused to index the readings of every following poll.
+    """
+    package_index = None
+    core_indices = []
+
+    for index, sensor in enumerate(sensors):
+        if "package id" in sensor.label.lower():
+            package_index = index
+        else:
+            core_indices.append(index)
+
+    core_indices.sort(key=lambda index: get_sort_key(sensors[index]))
+    core_labels = [f"Core {counter}" for counter in range(1, len(core_indices) + 1)]
+    core_short_labels = [f"C{counter}" for counter in range(1, len(core_indices) + 1)]
+
+    package_limits = None
+    if package_index is not None:
+        package_limits = (sensors[package_index].high, sensors[package_index].critical)
+    core_limits = [(sensors[index].high, sensors[index].critical) for index in core_indices]
+
+    # Static table segments, so each frame only formats the current temperatures
+    package_row_parts = None
+    if package_limits is not None:
+        package_row_parts = format_static_row_parts("", *package_limits)
+
+    core_rows = []
+    for index1, index2 in get_row_pairs(len(core_indices)):
+        # Column 1's suffix already ends with the spacer between columns
+        column1 = (index1, *format_static_row_parts(core_labels[index1], *core_limits[index1],
+                                                    ANSI_WHITE, COLUMN_SPACER))
+        column2 = None
+        if index2 is not None:
+            column2 = (index2, *format_static_row_parts(core_labels[index2], *core_limits[index2], ANSI_WHITE))
+        core_rows.append((column1, column2))
+
+    return CpuTopology(len(sensors), package_index, package_limits, package_row_parts,
+                       core_indices, core_labels, core_short_labels, core_limits, core_rows)
+
+def iso_timestamp_now():
+    """
+    Returns the current UTC time as an ISO 8601 string with second resolution.
+    The string is cached for the current second, so polling faster than once
+    per second doesn't rebuild it.
+    """
+    global _timestamp_cache
+    second = int(time.time())
+    if _timestamp_cache[0] != second:
+        _timestamp_cache = (second, datetime.fromtimestamp(second, timezone.utc).isoformat())
+    return _timestamp_cache[1]
+
+def get_cpu_data_structured(use_msr=False):
     """
     Fetches and structures CPU temperature data into a Python dictionary.
     This data can then be used for display or JSON output.
+    With use_msr, temperatures come from the thermal MSRs (or thermal zones)
+    instead of hwmon.
     """
+    global _topology
     data = {
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": iso_timestamp_now(),
         "overall_cpu_temp": None,
         "cores_temp": []
     }
 
+    available_sensor_keys = []
     try:
-        raw_temps = psutil.sensors_temperatures()
-        all_cpu_sensors = raw_temps.get('coretemp') or \
-                          raw_temps.get('k10temp') or \
-                          raw_temps.get('acpitz')
+        if use_msr:
+            all_cpu_sensors = read_msr_temperatures()
+            if not all_cpu_sensors:
+                data["error"] = ("No CPU temperature data found in the thermal MSRs or thermal zones. "
+                                 "Reading MSRs requires an Intel CPU, the msr kernel module and root.")
+                return data
+        else:
+            all_cpu_sensors = read_hwmon_temperatures()
+            if all_cpu_sensors is not None:
+                available_sensor_keys = _hwmon_names
+            else:
+                # No hwmon class in sysfs (not Linux), fall back to psutil.
+                # It is imported here, as it is only needed on these systems.
+                try:
+                    import psutil
+                except ImportError:
+                    data["error"] = "psutil is required to read CPU temperatures on systems without /sys/class/hwmon."
+                    return data
+                raw_temps = psutil.sensors_temperatures()
+                available_sensor_keys = list(raw_temps.keys())
+                all_cpu_sensors = raw_temps.get('coretemp') or \
+                                  raw_temps.get('k10temp') or \
+                                  raw_temps.get('acpitz')
 
         if not all_cpu_sensors:
             data["error"] = "No CPU temperature data found. This script might not support your system's sensor names."
-            data["available_sensor_keys"] = list(raw_temps.keys())
+            data["available_sensor_keys"] = available_sensor_keys
             return data
 
-        package_sensor = None
-        core_sensors = []
-
-        for sensor in all_cpu_sensors:
-            if "package id" in sensor.label.lower():
-                package_sensor = sensor
-            else:
-                core_sensors.append(sensor)
+        if _topology is None or _topology.sensor_count != len(all_cpu_sensors):
+            _topology = detect_cpu_topology(all_cpu_sensors)
 
-        if package_sensor:
+        # Only 'current' is taken from this poll, the rest comes from the topology
+        if _topology.package_index is not None:
+            high, critical = _topology.package_limits
             data["overall_cpu_temp"] = {
                 "label": "Overall",
-                "current": package_sensor.current,
-                "high": package_sensor.high,
-                "critical": package_sensor.critical
+                "current": all_cpu_sensors[_topology.package_index].current,
+                "high": high,
+                "critical": critical
             }
 
-        core_sensors.sort(key=get_sort_key)
-
-        core_counter = 1
-        for sensor in core_sensors:
+        for index, label, short_label, (high, critical) in zip(_topology.core_indices, _topology.core_labels,
+                                                               _topology.core_short_labels, _topology.core_limits):
+            sensor = all_cpu_sensors[index]
             data["cores_temp"].append({
-                "label": f"Core {core_counter}",
+                "label": label,
+                "short_label": short_label,
                 "original_label": sensor.label,
                 "current": sensor.current,
-                "high": sensor.high,
-                "critical": sensor.critical
+                "high": high,
+                "critical": critical
             })
-            core_counter += 1
     except Exception as e:
         data["error"] = f"Error during data collection: {e}"
-        data["available_sensor_keys"] = list(raw_temps.keys()) if 'raw_temps' in locals() else []
+        if available_sensor_keys:
+            data["available_sensor_keys"] = available_sensor_keys
     
     return data
 
 
-def display_cpu_temperatures(cpu_data):
+def format_temperature(temperature):
+    """Formats a temperature or limit, which some sensors don't report."""
+    return "N/A" if temperature is None else f"{temperature:.1f}°C"
+
+
+def format_static_row_parts(label, high, critical, label_color="", trailer=""):
     """
-    Displays CPU temperature data in a formatted console output.
-    Takes structured data from get_cpu_data_structured().
+    Returns the (prefix, suffix) strings around the 'current' cell of a row.
+    Labels and high/critical limits don't change between frames, so these are
+    formatted once, when the topology is detected.
+    trailer is appended to the suffix (e.g. the spacer between columns).
+    """
+    template = LABEL_TEMPLATE if label_color else PLAIN_LABEL_TEMPLATE
+    prefix = template.format_map({"color": label_color, "label": label})
+    suffix = LIMITS_TEMPLATE.format_map({"high": format_temperature(high), "critical": format_temperature(critical)}) + trailer
+    return prefix, suffix
+
+
+def to_decidegrees(temperature):
+    """Quantizes a temperature to the 0.1°C resolution shown on screen."""
+    return None if temperature is None else round(temperature * 10)
+
+
+@functools.lru_cache(maxsize=4096)
+def format_current_cell(deci_temp, near_critical=False):
+    """
+    Returns the colored, padded 'current' cell for a temperature in 0.1°C units.
+    Temperatures close to the sensor's critical limit are highlighted in bold red.
+    Displayed values are quantized to 0.1°C, so the cache hits almost always
+    once the temperatures settle.
+    """
+    if deci_temp is None:
+        return CURRENT_CELL_TEMPLATE.format_map({"color": "", "value": "N/A"})
+    temperature = deci_temp / 10
+    color = ANSI_BOLD_RED if near_critical else get_temp_color(temperature)
+    return CURRENT_CELL_TEMPLATE.format_map({"color": color, "value": f"{temperature:.1f}°C"})
+
+
+def get_row_pairs(num_cores):
     """
-    sys.stdout.write(f"{ANSI_CYAN}--- CPU Temperature Monitor ---{ANSI_RESET}\n")
+    Returns the (column 1, column 2) core indices of each row of the two-column
+    core table; column 2 is None on the last row when the core count is odd.
+    """
+    mid_point = (num_cores + 1) // 2
+    return [(i, i + mid_point if i + mid_point < num_cores else None) for i in range(mid_point)]
+
+
+def format_cpu_temperatures(cpu_data, topology):
+    """
+    Formats CPU temperature data into the rows of the console output.
+    Takes structured data from get_cpu_data_structured() and the topology it
+    was built with, which holds the static parts of the table rows.
+    """
+    rows = []
+    rows.append(f"{ANSI_CYAN}--- CPU Temperature Monitor ---{ANSI_RESET}")
 
     # --- Display Overall CPU Information (Header/Separate Line) ---
     if cpu_data.get("overall_cpu_temp"):
         package_info = cpu_data["overall_cpu_temp"]
-        package_color = get_temp_color(package_info["current"])
-        current_pkg_str = f"{package_info['current']:.1f}°C"
-        high_pkg_str = f"{package_info['high']:.1f}°C"
-        critical_pkg_str = f"{package_info['critical']:.1f}°C"
-        
-        PKG_LABEL_WIDTH = 12
-        PKG_VALUE_WIDTH = 7
-
-        sys.stdout.write("-" * 55 + "\n")
-        sys.stdout.write(f"{ANSI_BLUE}{'Overall':<{PKG_LABEL_WIDTH}}{'Current':<{PKG_VALUE_WIDTH+1}}{'High':<{PKG_VALUE_WIDTH+1}}{'Critical':<{PKG_VALUE_WIDTH+1}}{ANSI_RESET}\n")
-        sys.stdout.write("-" * 55 + "\n")
-        sys.stdout.write(f"{'':<{PKG_LABEL_WIDTH}}"
-                         f"{package_color}{current_pkg_str:<{PKG_VALUE_WIDTH+1}}{ANSI_RESET}"
-                         f"{high_pkg_str:<{PKG_VALUE_WIDTH+1}}{ANSI_RESET}"
-                         f"{critical_pkg_str:<{PKG_VALUE_WIDTH+1}}{ANSI_RESET}\n")
-        sys.stdout.write("-" * 55 + "\n")
+        pkg_prefix, pkg_suffix = topology.package_row_parts
+
+        rows.append("-" * 55)
+        rows.append(f"{ANSI_BLUE}{'Overall':<{LABEL_WIDTH}}{'Current':<{TEMP_VALUE_WIDTH+1}}{'High':<{TEMP_VALUE_WIDTH+1}}{'Critical':<{TEMP_VALUE_WIDTH+1}}{ANSI_RESET}")
+        rows.append("-" * 55)
+        rows.append("".join((pkg_prefix, format_current_cell(to_decidegrees(package_info["current"]), is_near_critical(package_info)), pkg_suffix)))
+        rows.append("-" * 55)
     elif "error" in cpu_data: # If a general error occurred during data collection
-        sys.stdout.write(f"{ANSI_YELLOW}{cpu_data['error']}{ANSI_RESET}\n")
+        rows.append(f"{ANSI_YELLOW}{cpu_data['error']}{ANSI_RESET}")
         if "available_sensor_keys" in cpu_data:
-            sys.stdout.write(f"{ANSI_YELLOW}Available sensor keys: {', '.join(cpu_data['available_sensor_keys'])}{ANSI_RESET}\n")
-        sys.stdout.write("-" * 55 + "\n")
-        sys.stdout.flush()
-        return
+            rows.append(f"{ANSI_YELLOW}Available sensor keys: {', '.join(cpu_data['available_sensor_keys'])}{ANSI_RESET}")
+        rows.append("-" * 55)
+        return rows
     else: # No overall data, but not a full error state (e.g., system only has cores)
-        sys.stdout.write(f"{ANSI_YELLOW}No 'Overall' (Package) temperature data found.{ANSI_RESET}\n")
-        sys.stdout.write("-" * 55 + "\n")
+        rows.append(f"{ANSI_YELLOW}No 'Overall' (Package) temperature data found.{ANSI_RESET}")
+        rows.append("-" * 55)
 
 
     # --- Display Individual Cores (Two Columns) ---
     core_sensors_data = cpu_data.get("cores_temp", [])
     if not core_sensors_data:
-        sys.stdout.write(f"{ANSI_YELLOW}No individual core temperature data available.{ANSI_RESET}\n")
-        sys.stdout.write("-" * 55 + "\n")
-        sys.stdout.flush()
-        return
+        rows.append(f"{ANSI_YELLOW}No individual core temperature data available.{ANSI_RESET}")
+        rows.append("-" * 55)
+        return rows
 
-    LABEL_WIDTH = 12
-    TEMP_VALUE_WIDTH = 7
-    
     LINE_LENGTH = (LABEL_WIDTH + 3 * (TEMP_VALUE_WIDTH + 1)) * 2 + 5
 
-    sys.stdout.write(f"{ANSI_CYAN}--- Individual Cores ---{ANSI_RESET}\n")
-    sys.stdout.write("-" * LINE_LENGTH + "\n")
+    rows.append(f"{ANSI_CYAN}--- Individual Cores ---{ANSI_RESET}")
+    rows.append("-" * LINE_LENGTH)
 
     col_header = f"{ANSI_BLUE}{'Core':<{LABEL_WIDTH}}{'Cur':<{TEMP_VALUE_WIDTH+1}}{'Hi':<{TEMP_VALUE_WIDTH+1}}{'Crit':<{TEMP_VALUE_WIDTH+1}}{ANSI_RESET}"
-    sys.stdout.write(f"{col_header}     {col_header}\n")
-
-    sys.stdout.write("-" * LINE_LENGTH + "\n")
-
-    num_cores = len(core_sensors_data)
-    mid_point = (num_cores + 1) // 2
+    rows.append(f"{col_header}{COLUMN_SPACER}{col_header}")
 
-    col1_cores = core_sensors_data[:mid_point]
-    col2_cores = core_sensors_data[mid_point:]
+    rows.append("-" * LINE_LENGTH)
 
-    for i in range(mid_point):
+    for (index1, prefix1, suffix1), column2 in topology.core_rows:
         # Column 1
-        sensor1_info = col1_cores[i]
-        display_label1 = sensor1_info["label"]
-        
-        color1 = get_temp_color(sensor1_info["current"])
-        current_temp_str1 = f"{sensor1_info['current']:.1f}°C"
-        high_temp_str1 = f"{sensor1_info['high']:.1f}°C"
-        critical_temp_str1 = f"{sensor1_info['critical']:.1f}°C"
-
-        line1 = (f"{ANSI_WHITE}{display_label1:<{LABEL_WIDTH}}{ANSI_RESET}"
-                 f"{color1}{current_temp_str1:<{TEMP_VALUE_WIDTH+1}}{ANSI_RESET}"
-                 f"{high_temp_str1:<{TEMP_VALUE_WIDTH+1}}{ANSI_RESET}"
-                 f"{critical_temp_str1:<{TEMP_VALUE_WIDTH+1}}{ANSI_RESET}")
+        sensor1_info = core_sensors_data[index1]
+        cell1 = format_current_cell(to_decidegrees(sensor1_info["current"]), is_near_critical(sensor1_info))
 
         # Column 2
-        line2 = ""
-        if i < len(col2_cores):
-            sensor2_info = col2_cores[i]
-            display_label2 = sensor2_info["label"]
-            
-            color2 = get_temp_color(sensor2_info["current"])
-            current_temp_str2 = f"{sensor2_info['current']:.1f}°C"
-            high_temp_str2 = f"{sensor2_info['high']:.1f}°C"
-            critical_temp_str2 = f"{sensor2_info['critical']:.1f}°C"
-
-            line2 = (f"{ANSI_WHITE}{display_label2:<{LABEL_WIDTH}}{ANSI_RESET}"
-                     f"{color2}{current_temp_str2:<{TEMP_VALUE_WIDTH+1}}{ANSI_RESET}"
-                     f"{high_temp_str2:<{TEMP_VALUE_WIDTH+1}}{ANSI_RESET}"
-                     f"{critical_temp_str2:<{TEMP_VALUE_WIDTH+1}}{ANSI_RESET}")
-
-        sys.stdout.write(f"{line1}     {line2}\n")
-
-    sys.stdout.write("-" * LINE_LENGTH + "\n")
-    sys.stdout.flush()
+        if column2 is None:
+            rows.append("".join((prefix1, cell1, suffix1)))
+            continue
+        index2, prefix2, suffix2 = column2
+        sensor2_info = core_sensors_data[index2]
+        cell2 = format_current_cell(to_decidegrees(sensor2_info["current"]), is_near_critical(sensor2_info))
+        rows.append("".join((prefix1, cell1, suffix1, prefix2, cell2, suffix2)))
+
+    rows.append("-" * LINE_LENGTH)
+    return rows
+
+
+def display_cpu_temperatures(cpu_data):
+    """
+    Displays CPU temperature data in a formatted console output.
+    The first frame clears the screen; later frames only rewrite the rows that
+    changed, addressing them with cursor positioning. The whole frame is redrawn
+    instead when the layout or the terminal size changed, when the frame doesn't
+    fit in the terminal (it would scroll and break the addressing), and every
+    FULL_REDRAW_INTERVAL seconds. The whole update is emitted with a single
+    write, so the terminal never shows a half-drawn frame.
+    When stdout is not a terminal, a full frame is appended whenever it changed.
+    """
+    global _prev_rows, _prev_terminal_size, _last_full_redraw
+    try:
+        rows = format_cpu_temperatures(cpu_data, _topology)
+    except Exception as e:
+        rows = [f"{ANSI_RED}An error occurred: {e}{ANSI_RESET}"]
+
+    if not IS_TTY:
+        parts = [row + "\n" for row in rows] if rows != _prev_rows else []
+        _prev_rows = rows
+        if parts:
+            write_frame(parts)
+        return
+
+    terminal_size = shutil.get_terminal_size()
+    now = time.monotonic()
+    if (len(rows) != len(_prev_rows)
+            or len(rows) >= terminal_size.lines
+            or terminal_size != _prev_terminal_size
+            or now - _last_full_redraw >= FULL_REDRAW_INTERVAL):
+        parts = [CLEAR_SCREEN]
+        parts.extend(row + "\n" for row in rows)
+        _prev_terminal_size = terminal_size
+        _last_full_redraw = now
+    else:
+        parts = [f"\x1b[{i + 1};1H{row}\x1b[K"
+                 for i, (row, prev_row) in enumerate(zip(rows, _prev_rows))
+                 if row != prev_row]
+        if parts:
+            # Park the cursor below the table again
+            parts.append(f"\x1b[{len(rows) + 1};1H")
+
+    _prev_rows = rows
+    if parts:
+        write_frame(parts)
+
+
+def sleep_until_next_tick(next_tick, interval):
+    """
+    Sleeps until the next tick of a fixed-cadence loop and returns its deadline.
+    Time spent working in the loop is subtracted from the sleep, so the period
+    doesn't drift. On overrun the cadence is re-synchronized to now.
+    The sleep returns early as soon as a stop is requested.
+    """
+    next_tick += interval
+    delay = next_tick - time.monotonic()
+    if delay > 0:
+        _stop_event.wait(delay)
+    else:
+        next_tick = time.monotonic()
+    return next_tick
+
+
+def get_adaptive_poll_interval(cpu_data, base_interval):
+    """
+    Scales the poll interval with the smallest headroom between any sensor and
+    its critical limit: base_interval at ADAPTIVE_MARGIN °C of headroom, faster
+    as temperatures approach the limit, slower (so idle cores can stay in deep
+    sleep states) when they are far from it.
+    """
+    sensors = list(cpu_data.get("cores_temp", []))
+    if cpu_data.get("overall_cpu_temp"):
+        sensors.append(cpu_data["overall_cpu_temp"])
+
+    margins = [get_temp_limit(sensor) - sensor["current"]
+               for sensor in sensors
+               if get_temp_limit(sensor) is not None and sensor["current"] is not None]
+    if not margins:
+        return base_interval
+
+    interval = base_interval * min(margins) / ADAPTIVE_MARGIN
+    return min(max(interval, MIN_POLL_INTERVAL), MAX_POLL_INTERVAL)
+
+
+def poll_cpu_data(latest, poll_interval, base_interval=None, use_msr=False):
+    """
+    Background sampler loop. Keeps latest[0] pointing at the newest snapshot
+    so the render loop never blocks on sensor I/O. Replacing the list item is
+    a single reference assignment, so no lock is needed.
+    With base_interval set, the interval adapts to the latest snapshot instead
+    of being fixed to poll_interval. use_msr is passed to get_cpu_data_structured().
+    """
+    next_tick = time.monotonic()
+    while True:
+        if base_interval is not None:
+            poll_interval = get_adaptive_poll_interval(latest[0], base_interval)
+        next_tick = sleep_until_next_tick(next_tick, poll_interval)
+        if _stop_event.is_set():
+            return
+        latest[0] = get_cpu_data_structured(use_msr)
+
+
+def request_stop(signum, frame):
+    """
+    SIGINT handler of interactive mode: asks the sampler and render loops to stop.
+    The default handler is restored, so a second Ctrl-C raises KeyboardInterrupt
+    and forces the exit even while a sensor read is blocking.
+    """
+    _stop_event.set()
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+
+
+def positive_float(value):
+    """argparse type for strictly positive, finite intervals (in seconds)."""
+    number = float(value)
+    if not math.isfinite(number) or number <= 0:
+        raise argparse.ArgumentTypeError(f"must be a finite number greater than 0, got {value}")
+    return number
 
 
 def main():
@@ -214,6 +820,32 @@ def main():
         action="store_true",
         help="Output a short, single-line version of current temperatures and exit."
     )
+    poll_group = parser.add_mutually_exclusive_group()
+    poll_group.add_argument(
+        "--poll-interval",
+        type=positive_float,
+        default=2.0,
+        help="Seconds between sensor reads in interactive mode (default: 2.0)."
+    )
+    poll_group.add_argument(
+        "--base-interval",
+        type=positive_float,
+        help=(f"Adapt the interval between sensor reads to the headroom left before the critical "
+              f"temperature: this many seconds at {ADAPTIVE_MARGIN:.0f}°C of headroom, faster when hotter "
+              f"and slower when cooler ({MIN_POLL_INTERVAL}s to {MAX_POLL_INTERVAL:.0f}s).")
+    )
+    parser.add_argument(
+        "--render-interval",
+        type=positive_float,
+        default=0.5,
+        help="Seconds between screen refreshes in interactive mode (default: 0.5)."
+    )
+    parser.add_argument(
+        "--msr",
+        action="store_true",
+        help=("Read temperatures from the Intel thermal MSRs (requires root and the msr kernel module) "
+              "for high-rate sampling, falling back to the CPU thermal zones.")
+    )
     args = parser.parse_args()
 
     # Handle mutually exclusive arguments
@@ -224,17 +856,17 @@ def main():
     # --- Mode selection ---
     if args.json or args.short:
         # For --json or --short, fetch data once
-        cpu_data = get_cpu_data_structured()
+        cpu_data = get_cpu_data_structured(args.msr)
 
         if "error" in cpu_data:
-            sys.stderr.write(f"{ANSI_RED}Error fetching CPU data: {cpu_data['error']}{ANSI_RESET}\n")
+            sys.stderr.write(f"{STDERR_RED}Error fetching CPU data: {cpu_data['error']}{STDERR_RESET}\n")
             if "available_sensor_keys" in cpu_data:
-                sys.stderr.write(f"{ANSI_YELLOW}Available sensor keys: {', '.join(cpu_data['available_sensor_keys'])}{ANSI_RESET}\n")
+                sys.stderr.write(f"{STDERR_YELLOW}Available sensor keys: {', '.join(cpu_data['available_sensor_keys'])}{STDERR_RESET}\n")
             sys.exit(1)
 
         if args.json:
             try:
-                json_output = json.dumps(cpu_data, indent=2)
+                json_output = dumps_json(cpu_data)
                 sys.stdout.write(json_output + "\n")
                 sys.stdout.flush()
             except Exception as e:
@@ -242,37 +874,44 @@ def main():
                 sys.exit(1)
             sys.exit(0) # Exit after JSON output
         elif args.short:
-            short_output_parts = []
-
-            # Overall CPU temperature
-            if cpu_data.get("overall_cpu_temp"):
-                short_output_parts.append(f"OV: {cpu_data['overall_cpu_temp']['current']:.1f}°C")
-            else:
-                short_output_parts.append("OV: N/A")
-
-            # Individual core temperatures
-            for core in cpu_data.get("cores_temp", []):
-                short_output_parts.append(f"{core['label'].replace('Core ', 'C')}: {core['current']:.1f}°C")
-
-            sys.stdout.write(" | ".join(short_output_parts) + "\n")
+            overall = cpu_data.get("overall_cpu_temp")
+            overall_str = format_temperature(overall["current"]) if overall else "N/A"
+            sys.stdout.write(" | ".join([
+                f"OV: {overall_str}",
+                *(f"{core['short_label']}: {format_temperature(core['current'])}" for core in cpu_data["cores_temp"])
+            ]) + "\n")
             sys.stdout.flush()
             sys.exit(0) # Exit after short output
     else:
         # Default interactive monitoring mode
+        # Ctrl-C only requests a stop, which wakes up both loops immediately.
+        # It is installed before the first read, so Ctrl-C during startup is clean too.
+        signal.signal(signal.SIGINT, request_stop)
+
         try:
-            while True:
-                clear_console()
-                try:
-                    cpu_data_live = get_cpu_data_structured()
-                    display_cpu_temperatures(cpu_data_live)
-                except Exception as e:
-                    sys.stdout.write(f"{ANSI_RED}An error occurred: {e}{ANSI_RESET}\n")
-                    sys.stdout.flush()
-                time.sleep(2)
+            # Sensors are sampled in a background thread, the loop below only renders
+            # the most recent snapshot.
+            latest = [get_cpu_data_structured(args.msr)]
+            poller = threading.Thread(
+                target=poll_cpu_data,
+                args=(latest, args.poll_interval, args.base_interval, args.msr),
+                daemon=True
+            )
+            poller.start()
+
+            next_tick = time.monotonic()
+            while not _stop_event.is_set():
+                display_cpu_temperatures(latest[0])
+                next_tick = sleep_until_next_tick(next_tick, args.render_interval)
+
+            # The poller and its hwmon reader threads are daemon threads, so a slow
+            # read only delays exit by STOP_JOIN_TIMEOUT
+            poller.join(timeout=STOP_JOIN_TIMEOUT)
         except KeyboardInterrupt:
-            sys.stdout.write(f"\n{ANSI_CYAN}Monitoring stopped.{ANSI_RESET}\n")
-            sys.stdout.flush()
-            sys.exit(0) # Exit cleanly
+            pass # Second Ctrl-C, forced exit
+        sys.stdout.write(f"\n{ANSI_CYAN}Monitoring stopped.{ANSI_RESET}\n")
+        sys.stdout.flush()
+        sys.exit(0) # Exit cleanly
 
 if __name__ == "__main__":
     main()
\ No newline at end of file